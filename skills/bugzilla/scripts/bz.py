@@ -772,9 +772,11 @@ def main():
 
     # whoami
     whoami_parser = subparsers.add_parser("whoami", help="Verify authentication")
+    whoami_parser.set_defaults(func=cmd_whoami)
 
     # get
     get_parser = subparsers.add_parser("get", help="Get bug details")
+    get_parser.set_defaults(func=cmd_get)
     get_parser.add_argument("bug_ids", nargs="+", help="Bug ID(s) to fetch")
     get_parser.add_argument("-c", "--include-comments", action="store_true", help="Include comments")
     get_parser.add_argument("-H", "--include-history", action="store_true", help="Include history")
@@ -784,6 +786,7 @@ def main():
 
     # search
     search_parser = subparsers.add_parser("search", help="Search for bugs")
+    search_parser.set_defaults(func=cmd_search)
     search_parser.add_argument("-q", "--quicksearch", help="Quick search text")
     search_parser.add_argument("-p", "--product", help="Product name")
     search_parser.add_argument("-c", "--component", help="Component name")
@@ -805,6 +808,7 @@ def main():
 
     # create
     create_parser = subparsers.add_parser("create", help="Create a new bug")
+    create_parser.set_defaults(func=cmd_create)
     create_parser.add_argument("-p", "--product", required=True, help="Product name")
     create_parser.add_argument("-c", "--component", required=True, help="Component name")
     create_parser.add_argument("-s", "--summary", required=True, help="Bug summary/title")
@@ -823,6 +827,7 @@ def main():
 
     # update
     update_parser = subparsers.add_parser("update", help="Update an existing bug")
+    update_parser.set_defaults(func=cmd_update)
     update_parser.add_argument("bug_id", help="Bug ID to update")
     update_parser.add_argument("-s", "--status", help="New status")
     update_parser.add_argument("-r", "--resolution", help="New resolution")
@@ -845,6 +850,7 @@ def main():
 
     # comment
     comment_parser = subparsers.add_parser("comment", help="Add a comment to a bug")
+    comment_parser.set_defaults(func=cmd_comment)
     comment_parser.add_argument("bug_id", help="Bug ID")
     comment_parser.add_argument("text", nargs="?", help="Comment text")
     comment_parser.add_argument("--text-file", help="Read comment text from file")
@@ -853,6 +859,7 @@ def main():
 
     # attachment
     attach_parser = subparsers.add_parser("attachment", help="Add an attachment to a bug")
+    attach_parser.set_defaults(func=cmd_attachment)
     attach_parser.add_argument("bug_id", help="Bug ID")
     attach_parser.add_argument("file", help="File to attach")
     attach_parser.add_argument("-s", "--summary", help="Attachment summary")
@@ -863,6 +870,7 @@ def main():
 
     # needinfo
     needinfo_parser = subparsers.add_parser("needinfo", help="Request or clear needinfo flag")
+    needinfo_parser.set_defaults(func=cmd_needinfo)
     needinfo_parser.add_argument("bug_id", help="Bug ID")
     needinfo_parser.add_argument("--request", help="Request needinfo from user (email)")
     needinfo_parser.add_argument("--clear", action="store_true", help="Clear needinfo flag")
@@ -870,6 +878,7 @@ def main():
 
     # products
     products_parser = subparsers.add_parser("products", help="List products or get product details")
+    products_parser.set_defaults(func=cmd_products)
     products_parser.add_argument("product", nargs="?", help="Product name to get details for")
     products_parser.add_argument("-v", "--verbose", action="store_true", help="Show component descriptions")
 
@@ -878,6 +887,7 @@ def main():
         "create-image-regression",
         help="Create a bug for a confirmed image regression",
     )
+    regress_parser.set_defaults(func=cmd_create_image_regression)
     regress_parser.add_argument(
         "--image-version",
         required=True,
@@ -956,20 +966,7 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    commands = {
-        "whoami": cmd_whoami,
-        "get": cmd_get,
-        "search": cmd_search,
-        "create": cmd_create,
-        "update": cmd_update,
-        "comment": cmd_comment,
-        "attachment": cmd_attachment,
-        "needinfo": cmd_needinfo,
-        "products": cmd_products,
-        "create-image-regression": cmd_create_image_regression,
-    }
-
-    commands[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
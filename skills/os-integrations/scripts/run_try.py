@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["pyyaml", "httpx", "taskcluster", "requests"]
+# dependencies = ["pyyaml", "httpx", "taskcluster", "requests", "urllib3>=2"]
 # ///
 """
 Construct and execute mach try commands for OS integration testing.
@@ -48,6 +48,8 @@ from pathlib import Path
 import requests
 import taskcluster
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from discover_tasks import fetch_task_graph, filter_by_worker_type
 
@@ -77,9 +79,28 @@ TASKCLUSTER_ROOT_URL = "https://firefox-ci-tc.services.mozilla.com"
 # Lando API URL
 LANDO_API_URL = "https://lando.services.mozilla.com/api/v1"
 
-# Default interval for checking Lando job status (in seconds)
+# Default (maximum) interval for checking Lando job status (in seconds)
 DEFAULT_LANDO_CHECK_INTERVAL = 90
 
+# First Lando status check interval; grows by LANDO_INTERVAL_GROWTH per poll
+# up to the maximum, so quick landings are noticed early without polling a
+# slow landing any more often than before
+LANDO_INITIAL_CHECK_INTERVAL = 10
+LANDO_INTERVAL_GROWTH = 1.5
+
+# Retry transient Lando API errors with jittered exponential backoff,
+# honoring Retry-After on 429/503 responses
+LANDO_RETRY = Retry(
+    total=5,
+    backoff_factor=1.5,
+    backoff_jitter=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+)
+
+_lando_session: requests.Session | None = None
+
 
 def get_latest_autoland_decision_task() -> str | None:
     """Get the latest autoland decision task ID from Taskcluster index.
@@ -129,11 +150,20 @@ def extract_lando_job_id_from_output(output: str) -> str | None:
     return None
 
 
+def get_lando_session() -> requests.Session:
+    """Get the shared Lando API session, which retries transient errors."""
+    global _lando_session
+    if _lando_session is None:
+        _lando_session = requests.Session()
+        _lando_session.mount("https://", HTTPAdapter(max_retries=LANDO_RETRY))
+    return _lando_session
+
+
 def check_lando_job_status(job_id: str) -> dict | None:
     """Check the status of a Lando landing job."""
     url = f"{LANDO_API_URL}/landing_jobs/{job_id}"
     try:
-        response = requests.get(url, timeout=30)
+        response = get_lando_session().get(url, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -142,16 +172,22 @@ def check_lando_job_status(job_id: str) -> dict | None:
 
 
 def poll_lando_job(job_id: str, interval: int = DEFAULT_LANDO_CHECK_INTERVAL) -> str | None:
-    """Poll Lando job status until it reaches a terminal state."""
+    """Poll Lando job status until it reaches a terminal state.
+
+    The delay between checks starts at LANDO_INITIAL_CHECK_INTERVAL and backs
+    off exponentially to `interval`.
+    """
     terminal_statuses = {"landed", "failed"}
-    print(f"\nPolling Lando job {job_id} every {interval} seconds...")
+    delay = min(LANDO_INITIAL_CHECK_INTERVAL, interval)
+    print(f"\nPolling Lando job {job_id} (every {delay}s, backing off to {interval}s)...")
     print(f"API: {LANDO_API_URL}/landing_jobs/{job_id}\n")
 
     while True:
         job_data = check_lando_job_status(job_id)
         if job_data is None:
             print("Warning: Could not fetch job status, retrying...")
-            time.sleep(interval)
+            time.sleep(delay)
+            delay = min(delay * LANDO_INTERVAL_GROWTH, interval)
             continue
 
         status = job_data.get("status", "unknown")
@@ -170,7 +206,8 @@ def poll_lando_job(job_id: str, interval: int = DEFAULT_LANDO_CHECK_INTERVAL) ->
                 print(f"\nLanding failed: {error}", file=sys.stderr)
             return status
 
-        time.sleep(interval)
+        time.sleep(delay)
+        delay = min(delay * LANDO_INTERVAL_GROWTH, interval)
 
 
 def run_treeherder_cli_watch(revision: str, filter_regex: str | None = None) -> None:
@@ -603,7 +640,8 @@ Examples:
         type=int,
         default=DEFAULT_LANDO_CHECK_INTERVAL,
         metavar="SECONDS",
-        help=f"Interval between Lando status checks (default: {DEFAULT_LANDO_CHECK_INTERVAL}s)",
+        help=f"Maximum interval between Lando status checks; polling starts at "
+        f"{LANDO_INITIAL_CHECK_INTERVAL}s and backs off to it (default: {DEFAULT_LANDO_CHECK_INTERVAL}s)",
     )
     parser.add_argument(
         "--dry-run",
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["treeherder-client", "requests"]
+# dependencies = ["treeherder-client", "requests", "requests-cache", "orjson"]
 # ///
 """
 Sheriff Triage Tool
@@ -18,15 +18,32 @@ Verdicts:
 - NEEDS_INVESTIGATION: Unclear cause
 """
 
+from __future__ import annotations
+
 import argparse
 import json
+import math
 import os
 import re
 import subprocess
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Collection, Optional
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import orjson
+except ImportError:  # Run with plain python3 instead of uv; fall back to json
+    orjson = None
 
-from thclient import TreeherderClient
+# thclient (which pulls in requests) is imported where it is used, so --help,
+# argument errors and Taskcluster-only work don't pay for the HTTP stack.
+if TYPE_CHECKING:
+    import requests
+    from thclient import TreeherderClient
 
 
 # Treeherder classification IDs
@@ -40,8 +57,140 @@ CLASSIFICATION_NAMES = {
     7: "autoclassified intermittent",
 }
 
+# Job results that count as failures when scanning pushes
+FAILED_RESULTS = frozenset({"testfailed", "busted"})
+
+# Concurrent Treeherder requests when scanning pushes (within the session's pool)
+TREEHERDER_MAX_WORKERS = 16
+
+# Most pushes covered by one push_id__in jobs request. Batches are made
+# smaller than this when needed so every worker gets one.
+PUSHES_PER_JOBS_REQUEST = 50
+
 DEFAULT_TASKCLUSTER_ROOT_URL = "https://firefox-ci-tc.services.mozilla.com"
 
+# How long per-push job scans are kept in the on-disk cache. Only scans whose
+# jobs have all completed are stored, and task-ID lookups are never cached, so
+# a job's current classification is always read fresh.
+PUSH_JOBS_CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+_treeherder_client: Optional[TreeherderClient] = None
+_cache_enabled = True
+
+
+def get_cache_path() -> Path:
+    """Location of the on-disk Treeherder response cache (sqlite)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "sheriff-triage" / "treeherder"
+
+
+def is_cacheable(response: requests.Response) -> bool:
+    """Cache per-push job scans once every job in them has completed."""
+    query = parse_qs(urlsplit(response.url).query)
+    if "push_id" not in query and "push_id__in" not in query:
+        return False
+    # requests-cache runs this filter on fresh and cached responses alike (for
+    # fresh ones, twice) and hands the same response object to get_json, so
+    # the decoded body is kept on it and each page is parsed only once.
+    data = getattr(response, "_decoded_json", None)
+    if data is None:
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            return False
+        response._decoded_json = data
+    rows = data.get("results", [])
+    names = data.get("job_property_names")
+    if names is None:
+        return all(job.get("state") == "completed" for job in rows)
+    if "state" not in names:
+        return False
+    state = names.index("state")
+    return all(row[state] == "completed" for row in rows)
+
+
+def job_results(data: dict) -> list[dict]:
+    """Jobs in a Treeherder jobs response, expanding return_type=list rows."""
+    rows = data.get("results", [])
+    names = data.get("job_property_names")
+    if names is None:
+        return rows
+    return [dict(zip(names, row)) for row in rows]
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when available (raises ValueError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def print_json(data: Any) -> None:
+    """Pretty-print JSON to stdout, writing orjson's bytes straight to the buffer."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json.dumps(data, indent=2))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    buffer.flush()
+
+
+def get_json(client: TreeherderClient, endpoint: str, project: Optional[str] = None, **params) -> dict:
+    """
+    Drop-in for TreeherderClient._get_json that decodes with orjson.
+
+    A similar-failure scan parses many full pages of jobs, concurrently;
+    orjson does that several times faster than requests' stdlib decoder.
+    """
+    url = client._get_endpoint_url(endpoint, project=project)
+    response = client.session.get(url, params=params, timeout=client.timeout)
+    response.raise_for_status()
+    data = getattr(response, "_decoded_json", None)
+    return data if data is not None else json_loads(response.content)
+
+
+def get_treeherder_client() -> TreeherderClient:
+    """
+    Get the shared TreeherderClient.
+
+    All Treeherder lookups in a triage run go through one pooled keep-alive
+    session, with transient failures (429/5xx) on GETs retried with backoff.
+    Unless disabled with --no-cache, finished push scans are cached on disk
+    (see PUSH_JOBS_CACHE_EXPIRE_AFTER).
+    """
+    global _treeherder_client
+    if _treeherder_client is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from thclient import TreeherderClient
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+        if _cache_enabled:
+            import requests_cache
+
+            session = requests_cache.CachedSession(
+                str(get_cache_path()),
+                backend="sqlite",
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after={"treeherder.mozilla.org/api/project/*/jobs/": PUSH_JOBS_CACHE_EXPIRE_AFTER},
+                filter_fn=is_cacheable,
+            )
+        else:
+            session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        session.headers.update(TreeherderClient.REQUEST_HEADERS)
+        _treeherder_client = TreeherderClient()
+        _treeherder_client.session = session
+        _treeherder_client._get_json = partial(get_json, _treeherder_client)
+    return _treeherder_client
+
 
 def extract_task_id(task_id_or_url: str) -> str:
     """Extract task ID from a Taskcluster URL or return as-is."""
@@ -134,29 +283,103 @@ def get_production_pool(alpha_pool: str) -> str:
     return alpha_pool
 
 
+def fetch_push_jobs(
+    client: TreeherderClient,
+    repo: str,
+    pushes: list[dict],
+) -> dict[int, list]:
+    """
+    Fetch the failed jobs (see FAILED_RESULTS) of several pushes, keyed by push ID.
+
+    Pushes are requested in batches with push_id__in, sized so the batches
+    spread across TREEHERDER_MAX_WORKERS and run concurrently over the shared
+    session. If the server ignores the push_id__in filter (jobs from other
+    pushes come back), that batch's pushes are refetched one request per
+    push, also through the pool.
+    """
+
+    def fetch(wanted: Optional[Collection[int]] = None, **params) -> Optional[list]:
+        # The jobs endpoint filters on an exact result, so ask once per failing
+        # result (full pages) and merge back into job ID order. Job names are
+        # matched by the caller. With `wanted`, give up (None) as soon as a job
+        # from another push shows up.
+        # return_type=list sends each job as a row of values plus one shared
+        # list of property names, instead of repeating every key per job.
+        jobs: list = []
+        for result in sorted(FAILED_RESULTS):
+            offset = 0
+            while True:
+                data = client._get_json(
+                    client.JOBS_ENDPOINT,
+                    project=repo,
+                    result=result,
+                    count=client.MAX_COUNT,
+                    offset=offset,
+                    return_type="list",
+                    **params,
+                )
+                page = job_results(data)
+                if wanted is not None and any(job.get("push_id") not in wanted for job in page):
+                    return None
+                jobs.extend(page)
+                offset += len(page)
+                if len(page) < client.MAX_COUNT:
+                    break
+        return sorted(jobs, key=lambda job: job["id"])
+
+    def fetch_batch(push_ids: list[int]) -> Optional[dict[int, list]]:
+        # None means the server ignored push_id__in; the caller refetches per push
+        if len(push_ids) == 1:
+            return {push_ids[0]: fetch(push_id=push_ids[0])}
+        by_push: dict[int, list] = {push_id: [] for push_id in push_ids}
+        jobs = fetch(wanted=by_push.keys(), push_id__in=",".join(map(str, push_ids)))
+        if jobs is None:
+            return None
+        for job in jobs:
+            by_push[job["push_id"]].append(job)
+        return by_push
+
+    push_ids = [push["id"] for push in pushes]
+    batch_size = min(PUSHES_PER_JOBS_REQUEST, math.ceil(len(push_ids) / TREEHERDER_MAX_WORKERS)) or 1
+    batches = [push_ids[i : i + batch_size] for i in range(0, len(push_ids), batch_size)]
+
+    jobs_by_push: dict[int, list] = {}
+    fallback: list[int] = []
+    with ThreadPoolExecutor(max_workers=TREEHERDER_MAX_WORKERS) as pool:
+        for batch, batch_jobs in zip(batches, pool.map(fetch_batch, batches)):
+            if batch_jobs is None:
+                fallback.extend(batch)
+            else:
+                jobs_by_push.update(batch_jobs)
+        for push_id, jobs in zip(fallback, pool.map(lambda push_id: fetch(push_id=push_id), fallback)):
+            jobs_by_push[push_id] = jobs
+    return jobs_by_push
+
+
 def find_similar_failures_treeherder(
     job_name: str,
     repos: list[str],
     limit: int = 50,
 ) -> dict:
     """Search for similar failures on Treeherder."""
-    client = TreeherderClient()
+    client = get_treeherder_client()
     results = {"autoland": [], "mozilla-central": []}
+    needle = job_name.lower()
 
     for repo in repos:
         try:
             data = client._get_json(client.PUSH_ENDPOINT, project=repo, count=limit)
             pushes = data.get("results", [])
+            jobs_by_push = fetch_push_jobs(client, repo, pushes)
 
             for push in pushes:
-                push_id = push["id"]
-                jobs_data = client._get_json(client.JOBS_ENDPOINT, project=repo, push_id=push_id)
-                jobs = jobs_data.get("results", [])
-
+                # The server has already filtered by result; the name is
+                # matched here, and the result check guards against a server
+                # that ignored the filter.
                 matching_failures = [
-                    j for j in jobs
-                    if job_name.lower() in j.get("job_type_name", "").lower()
-                    and j.get("result") in ["testfailed", "busted"]
+                    j for j in jobs_by_push[push["id"]]
+                    if j.get("result") in FAILED_RESULTS
+                    and needle in j.get("job_type_name", "").lower()
                 ]
 
                 for job in matching_failures:
@@ -176,7 +399,7 @@ def find_similar_failures_treeherder(
 
 def get_treeherder_classification(task_id: str) -> dict | None:
     """Get classification for a job from Treeherder by task ID."""
-    client = TreeherderClient()
+    client = get_treeherder_client()
 
     # Search across repos
     for repo in ["autoland", "mozilla-central", "try"]:
@@ -387,61 +610,65 @@ def triage(
     }
 
     if json_output:
-        print(json.dumps(result, indent=2))
+        print_json(result)
     else:
-        # Print markdown report
-        print(f"\n## Triage Report: {task_id}\n")
-        print(f"**Test**: {task_label}")
-        print(f"**Status**: {state}")
-        print()
-        print("### Signals")
-        print()
-        print("| Signal | Value | Implication |")
-        print("|--------|-------|-------------|")
-        print(f"| Alpha Pool | {'Yes' if is_alpha else 'No'} | {'Using new/staging image' if is_alpha else 'Production pool'} |")
+        # Build the markdown report and write it in one go
+        out: list[str] = []
+        p = out.append
+        p(f"\n## Triage Report: {task_id}\n")
+        p(f"**Test**: {task_label}")
+        p(f"**Status**: {state}")
+        p("")
+        p("### Signals")
+        p("")
+        p("| Signal | Value | Implication |")
+        p("|--------|-------|-------------|")
+        p(f"| Alpha Pool | {'Yes' if is_alpha else 'No'} | {'Using new/staging image' if is_alpha else 'Production pool'} |")
 
         if is_alpha:
-            print(f"| Image Version Differs | {'Yes' if version_differs else 'No'} ({failing_version} vs {production_version}) | {'Image change detected' if version_differs else 'Same image'} |")
+            p(f"| Image Version Differs | {'Yes' if version_differs else 'No'} ({failing_version} vs {production_version}) | {'Image change detected' if version_differs else 'Same image'} |")
 
         if not skip_treeherder:
-            print(f"| Similar Failures on autoland | {autoland_failures} | {'Failing on production' if autoland_failures > 0 else 'Not failing on production'} |")
-            print(f"| Similar Failures on mozilla-central | {central_failures} | {'Failing on production' if central_failures > 0 else 'Not failing on production'} |")
-
-        print(f"| Treeherder Classification | {classification_name} | {'Already triaged' if classification_id != 1 else 'No prior triage'} |")
-        print()
-        print(f"### Verdict: **{verdict}**")
-        print()
-        print(f"**Confidence**: {confidence}")
-        print(f"**Rationale**: {rationale}")
-        print()
-        print("### Recommended Actions")
-        print()
+            p(f"| Similar Failures on autoland | {autoland_failures} | {'Failing on production' if autoland_failures > 0 else 'Not failing on production'} |")
+            p(f"| Similar Failures on mozilla-central | {central_failures} | {'Failing on production' if central_failures > 0 else 'Not failing on production'} |")
+
+        p(f"| Treeherder Classification | {classification_name} | {'Already triaged' if classification_id != 1 else 'No prior triage'} |")
+        p("")
+        p(f"### Verdict: **{verdict}**")
+        p("")
+        p(f"**Confidence**: {confidence}")
+        p(f"**Rationale**: {rationale}")
+        p("")
+        p("### Recommended Actions")
+        p("")
 
         if verdict == "IMAGE_REGRESSION":
-            print("1. Notify image maintainer")
-            print("2. Check SBOM for image changes")
-            print("3. Consider rolling back image or fixing the issue")
+            p("1. Notify image maintainer")
+            p("2. Check SBOM for image changes")
+            p("3. Consider rolling back image or fixing the issue")
         elif verdict == "CODE_REGRESSION":
-            print("1. Identify the regressing commit")
-            print("2. Consider backout or fix")
-            print("3. Star/classify the failures in Treeherder")
+            p("1. Identify the regressing commit")
+            p("2. Consider backout or fix")
+            p("3. Star/classify the failures in Treeherder")
         elif verdict == "INTERMITTENT":
-            print("1. No action needed if already filed")
-            print("2. Check if failure rate is increasing")
+            p("1. No action needed if already filed")
+            p("2. Check if failure rate is increasing")
         elif verdict == "INFRA":
-            print("1. Check infrastructure status")
-            print("2. Report to RelOps if persistent")
+            p("1. Check infrastructure status")
+            p("2. Report to RelOps if persistent")
         else:
-            print("1. Manual investigation needed")
-            print("2. Check task logs for more details")
-            print("3. Compare with similar tasks")
-
-        print()
-        print("### Links")
-        print()
-        print(f"- **Taskcluster**: {result['taskclusterUrl']}")
+            p("1. Manual investigation needed")
+            p("2. Check task logs for more details")
+            p("3. Compare with similar tasks")
+
+        p("")
+        p("### Links")
+        p("")
+        p(f"- **Taskcluster**: {result['taskclusterUrl']}")
         if result["sbomUrl"]:
-            print(f"- **SBOM**: {result['sbomUrl']}")
+            p(f"- **SBOM**: {result['sbomUrl']}")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
@@ -489,9 +716,17 @@ Examples:
         action="store_true",
         help="Output as JSON",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk Treeherder response cache",
+    )
 
     args = parser.parse_args()
 
+    global _cache_enabled
+    _cache_enabled = not args.no_cache
+
     return triage(
         args.task_id,
         root_url=args.root_url,
@@ -0,0 +1,108 @@
+"""Tests for scripts/triage.py (run: python -m unittest discover skills/sheriff-triage/tests)."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import triage  # noqa: E402
+
+
+RESULTS = ["busted", "testfailed", "success"]
+
+
+def all_jobs_for(push_id: int) -> list[dict]:
+    return [
+        {"id": push_id * 10 + k, "push_id": push_id, "job_type_name": f"test-linux/opt-mochitest-{k}", "result": RESULTS[k % 3]}
+        for k in range(4)
+    ]
+
+
+def jobs_for(push_id: int) -> list[dict]:
+    """The push's failed jobs, in job ID order."""
+    return [job for job in all_jobs_for(push_id) if job["result"] in triage.FAILED_RESULTS]
+
+
+class FakeClient:
+    """Stands in for TreeherderClient's jobs endpoint, recording each request's filters."""
+
+    JOBS_ENDPOINT = "jobs"
+    MAX_COUNT = 2000
+
+    def __init__(self, honor_push_id_in: bool = True):
+        self.honor_push_id_in = honor_push_id_in
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _get_json(self, endpoint, project=None, **params):
+        with self._lock:
+            self.calls.append(params)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+
+        if params.get("offset"):
+            return {"results": []}
+        if "push_id" in params:
+            push_ids = [params["push_id"]]
+        elif "push_id__in" in params and self.honor_push_id_in:
+            push_ids = [int(push_id) for push_id in params["push_id__in"].split(",")]
+        else:
+            push_ids = range(100)
+        jobs = [job for push_id in push_ids for job in all_jobs_for(push_id)]
+        return {"results": [job for job in jobs if params.get("result") in (None, job["result"])]}
+
+
+class FetchPushJobsTest(unittest.TestCase):
+    pushes = [{"id": push_id} for push_id in range(50)]
+
+    def assert_jobs_by_push(self, jobs_by_push: dict) -> None:
+        self.assertEqual(sorted(jobs_by_push), list(range(50)))
+        for push_id, jobs in jobs_by_push.items():
+            self.assertEqual(jobs, jobs_for(push_id))
+
+    def test_batches_spread_across_workers(self):
+        client = FakeClient()
+        jobs_by_push = triage.fetch_push_jobs(client, "autoland", self.pushes)
+
+        self.assert_jobs_by_push(jobs_by_push)
+        batches = sorted({call["push_id__in"] for call in client.calls})
+        batches = [batch.split(",") for batch in batches]
+        self.assertEqual(len(batches), 13)  # ceil(50 / 16) = 4 pushes per batch
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertEqual(sorted(int(p) for batch in batches for p in batch), list(range(50)))
+        self.assertGreater(client.max_in_flight, 1)
+
+    def test_falls_back_to_per_push_requests_through_pool(self):
+        client = FakeClient(honor_push_id_in=False)
+        jobs_by_push = triage.fetch_push_jobs(client, "autoland", self.pushes)
+
+        self.assert_jobs_by_push(jobs_by_push)
+        per_push = {call["push_id"] for call in client.calls if "push_id" in call}
+        self.assertEqual(sorted(per_push), list(range(50)))
+        self.assertGreater(client.max_in_flight, 1)
+
+    def test_single_push_uses_push_id(self):
+        client = FakeClient()
+        jobs_by_push = triage.fetch_push_jobs(client, "autoland", [{"id": 3}])
+
+        self.assertEqual(jobs_by_push, {3: jobs_for(3)})
+        self.assertEqual([call.get("push_id") for call in client.calls], [3, 3])
+
+    def test_requests_filter_by_failed_result(self):
+        client = FakeClient()
+        triage.fetch_push_jobs(client, "autoland", [{"id": 3}])
+
+        self.assertEqual(sorted(call["result"] for call in client.calls), sorted(triage.FAILED_RESULTS))
+        self.assertFalse(any("job_type_name__icontains" in call for call in client.calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = ["orjson"]
 # ///
 """
 Taskcluster helper for operations not covered by the native CLI.
@@ -28,17 +28,65 @@ This script handles what the native CLI cannot:
 """
 
 import argparse
+import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
 import tempfile
-from typing import Any, Optional
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+
+try:
+    import orjson
+except ImportError:  # Run with plain python3 instead of uv; fall back to json
+    orjson = None
 
 # Default Taskcluster root URL for Firefox CI
 DEFAULT_TASKCLUSTER_ROOT_URL = "https://firefox-ci-tc.services.mozilla.com"
 
+# Environment for taskcluster CLI subprocesses, built once. subprocess never
+# mutates the mapping it is given, so every call can share it.
+_TASKCLUSTER_ENV = os.environ.copy()
+_TASKCLUSTER_ENV.setdefault("TASKCLUSTER_ROOT_URL", DEFAULT_TASKCLUSTER_ROOT_URL)
+
+# Characters allowed in a (22 character, URL-safe base64) slug task ID
+TASK_ID_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+
+# Task or task group ID embedded in a Taskcluster web UI URL
+TASK_URL_RE = re.compile(r'https?://[^/]+/(?:tasks|task-group)/([A-Za-z0-9_-]{22})')
+
+# REST paths (relative to /api/queue/v1) of the paginated queue list endpoints.
+# Without credentials these are fetched in-process (unauthenticated) instead of
+# forking the taskcluster CLI once per page; see fetch_paginated_queue.
+QUEUE_LIST_PATHS = {
+    "listArtifacts": "/task/{}/runs/{}/artifacts",
+    "listLatestArtifacts": "/task/{}/artifacts",
+    "listTaskGroup": "/task-group/{}/list",
+}
+
+# How long a task group's actions.json is reused from the on-disk cache
+ACTIONS_CACHE_TTL_SECONDS = 600
+
+# Chunk size for streaming pretty-printed JSON to stdout
+JSON_WRITE_CHUNK_SIZE = 64 * 1024
+
+# Statuses after which http_get follows the Location header
+HTTP_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Items requested per queue list page (the queue's maximum; default is ~100)
+QUEUE_PAGE_LIMIT = 1000
+
+# Keep-alive HTTP connections, keyed by (scheme, host), reused across requests
+_HTTP_CONNECTIONS: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
 
 def extract_task_id(task_id_or_url: str) -> str:
     """
@@ -49,13 +97,54 @@ def extract_task_id(task_id_or_url: str) -> str:
     - https://stage.taskcluster.nonprod.cloudops.mozgcp.net/tasks/<TASK_ID>
     - https://community-tc.services.mozilla.com/tasks/<TASK_ID>
     """
-    url_pattern = r'https?://[^/]+/(?:tasks|task-group)/([A-Za-z0-9_-]{22})'
-    match = re.search(url_pattern, task_id_or_url)
+    # Fast path for the common case of a bare task ID
+    if len(task_id_or_url) == 22 and TASK_ID_CHARS.issuperset(task_id_or_url):
+        return task_id_or_url
+
+    match = TASK_URL_RE.search(task_id_or_url)
     if match:
         return match.group(1)
     return task_id_or_url
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when available (raises json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize JSON compactly to UTF-8 bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def print_json(data: Any) -> None:
+    """
+    Pretty-print JSON to stdout.
+
+    Output is encoded incrementally and written in chunks, so large listings
+    (e.g. artifacts of a big task) never exist as a single string. This stays
+    on the stdlib encoder even when orjson is available: orjson writes
+    non-ASCII text as raw UTF-8 rather than \\uXXXX escapes, which would change
+    the output.
+    """
+    encoder = json.JSONEncoder(indent=2)
+    pending: list[str] = []
+    pending_size = 0
+    for chunk in encoder.iterencode(data):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= JSON_WRITE_CHUNK_SIZE:
+            sys.stdout.write("".join(pending))
+            pending.clear()
+            pending_size = 0
+    pending.append("\n")
+    sys.stdout.write("".join(pending))
+
+
 def run_taskcluster_cmd(
     args: list[str], expect_json: bool = True
 ) -> tuple[int, dict[str, Any] | list[Any] | str | None]:
@@ -71,16 +160,14 @@ def run_taskcluster_cmd(
     """
     cmd = ["taskcluster"] + args
 
-    env = os.environ.copy()
-    if "TASKCLUSTER_ROOT_URL" not in env:
-        env["TASKCLUSTER_ROOT_URL"] = DEFAULT_TASKCLUSTER_ROOT_URL
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, env=env)
+        # Output stays bytes: JSON parsing accepts UTF-8 bytes directly, so
+        # large responses skip a text decode and newline translation pass.
+        result = subprocess.run(cmd, capture_output=True, check=False, env=_TASKCLUSTER_ENV)
 
         if result.returncode != 0:
             if result.stderr:
-                print(result.stderr, file=sys.stderr)
+                print(result.stderr.decode("utf-8", "replace"), file=sys.stderr)
             return result.returncode, None
 
         if expect_json:
@@ -88,13 +175,13 @@ def run_taskcluster_cmd(
                 print("Error: Command returned empty output; expected JSON", file=sys.stderr)
                 return 1, None
             try:
-                return 0, json.loads(result.stdout)
+                return 0, json_loads(result.stdout)
             except json.JSONDecodeError:
                 print("Error: Command returned non-JSON output; expected JSON", file=sys.stderr)
-                print(result.stdout.strip(), file=sys.stderr)
+                print(result.stdout.decode("utf-8", "replace").strip(), file=sys.stderr)
                 return 1, None
 
-        return 0, result.stdout
+        return 0, result.stdout.decode("utf-8", "replace")
 
     except FileNotFoundError:
         print("Error: taskcluster CLI not found. Install with: brew install taskcluster", file=sys.stderr)
@@ -104,48 +191,178 @@ def run_taskcluster_cmd(
         return 1, None
 
 
+def _http_get_once(url: str, timeout: float) -> tuple[int, Optional[str], bytes]:
+    """
+    Issue a single GET over the keep-alive connection for the URL's host.
+
+    Returns:
+        Tuple of (http_status, location_header, response_body).
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+    retried = False
+    while True:
+        conn = _HTTP_CONNECTIONS.get(key)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(parts.netloc, timeout=timeout)
+            _HTTP_CONNECTIONS[key] = conn
+        try:
+            conn.request("GET", path, headers={"Accept": "application/json", "Accept-Encoding": "gzip"})
+            response = conn.getresponse()
+            body = response.read()
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return response.status, response.getheader("Location"), body
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped an idle keep-alive connection; reconnect once.
+            conn.close()
+            del _HTTP_CONNECTIONS[key]
+            if retried:
+                raise
+            retried = True
+        except Exception:
+            # Never reuse a connection left mid-request (e.g. after a timeout)
+            conn.close()
+            del _HTTP_CONNECTIONS[key]
+            raise
+
+
+def http_get(url: str, timeout: float = 30, max_redirects: int = 5) -> tuple[int, bytes]:
+    """
+    GET a URL over a keep-alive connection that is reused per host.
+
+    Redirects are followed (artifact URLs redirect to storage), and responses
+    are requested gzip-compressed and transparently decompressed.
+
+    Returns:
+        Tuple of (http_status, response_body).
+    """
+    for _ in range(max_redirects):
+        status, location, body = _http_get_once(url, timeout)
+        if status not in HTTP_REDIRECT_STATUSES or not location:
+            return status, body
+        url = urljoin(url, location)
+    status, _, body = _http_get_once(url, timeout)
+    return status, body
+
+
+def queue_get(path: str, query: Optional[dict[str, str]] = None) -> tuple[int, Any]:
+    """
+    Call a read-only queue endpoint in-process and parse the JSON response.
+
+    Args:
+        path: Endpoint path relative to /api/queue/v1 (e.g. "/task-group/<id>/list").
+        query: Optional query string parameters.
+
+    Returns:
+        Tuple of (exit_code, parsed_output).
+    """
+    root_url = _TASKCLUSTER_ENV["TASKCLUSTER_ROOT_URL"].rstrip("/")
+    url = f"{root_url}/api/queue/v1{path}"
+    if query:
+        url = f"{url}?{urlencode(query)}"
+
+    try:
+        status, body = http_get(url)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Error requesting {url}: {e}", file=sys.stderr)
+        return 1, None
+
+    if status != 200:
+        print(f"Error: {url} returned HTTP {status}", file=sys.stderr)
+        if body:
+            print(body.decode("utf-8", "replace"), file=sys.stderr)
+        return 1, None
+
+    try:
+        return 0, json_loads(body)
+    except json.JSONDecodeError:
+        print(f"Error: {url} returned non-JSON output; expected JSON", file=sys.stderr)
+        return 1, None
+
+
+def has_taskcluster_credentials() -> bool:
+    """Whether TASKCLUSTER_CLIENT_ID/TASKCLUSTER_ACCESS_TOKEN are set (e.g. by `taskcluster signin`)."""
+    return bool(_TASKCLUSTER_ENV.get("TASKCLUSTER_CLIENT_ID") and _TASKCLUSTER_ENV.get("TASKCLUSTER_ACCESS_TOKEN"))
+
+
 def fetch_paginated_queue(
     method: str,
     method_args: list[str],
     items_key: str,
+    reducer: Optional[Callable[[list[Any]], None]] = None,
 ) -> tuple[int, dict[str, Any] | None]:
     """
     Fetch all pages for queue endpoints that return continuationToken.
 
-    Returns a merged response where `items_key` contains all items.
+    `method` must be one of QUEUE_LIST_PATHS. All pages are fetched over a
+    single keep-alive connection rather than one CLI process per page, and
+    the next page is prefetched while the current one is processed. Those
+    in-process requests are unauthenticated, so when Taskcluster credentials
+    are set each page goes through the taskcluster CLI instead, which signs
+    it and can read deployments or artifacts that need scopes.
+
+    Returns a merged response where `items_key` contains all items. If
+    `reducer` is given, each page's items are passed to it instead and are
+    not retained, so callers that only need aggregates do not hold every
+    item in memory; `items_key` is then omitted from the merged response.
     """
-    continuation: Optional[str] = None
     merged_items: list[Any] = []
     last_page: Optional[dict[str, Any]] = None
 
-    while True:
-        args = ["api", "queue", method, *method_args]
+    path = QUEUE_LIST_PATHS[method].format(*method_args)
+
+    def fetch_page(continuation: Optional[str]) -> tuple[int, Any]:
+        if has_taskcluster_credentials():
+            args = ["api", "queue", method, *method_args]
+            if continuation:
+                args.extend(["--continuationToken", continuation])
+            return run_taskcluster_cmd(args, expect_json=True)
+        query = {"limit": str(QUEUE_PAGE_LIMIT)}
         if continuation:
-            args.extend(["--continuationToken", continuation])
-
-        code, data = run_taskcluster_cmd(args, expect_json=True)
-        if code != 0:
-            return code, None
-        if not isinstance(data, dict):
-            print(f"Error: Unexpected response type from queue {method}", file=sys.stderr)
-            return 1, None
-
-        page_items = data.get(items_key, [])
-        if not isinstance(page_items, list):
-            print(f"Error: Expected '{items_key}' to be a list in queue {method} response", file=sys.stderr)
-            return 1, None
-        merged_items.extend(page_items)
-
-        continuation = data.get("continuationToken")
-        last_page = data
-        if not continuation:
-            break
+            query["continuationToken"] = continuation
+        return queue_get(path, query)
+
+    # Pages form a serial continuationToken chain, so the only overlap
+    # available is to request page N+1 as soon as page N's token is known,
+    # while page N is still being reduced/merged on this thread.
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        pending = prefetcher.submit(fetch_page, None)
+        while True:
+            code, data = pending.result()
+            if code != 0:
+                return code, None
+            if not isinstance(data, dict):
+                print(f"Error: Unexpected response type from queue {method}", file=sys.stderr)
+                return 1, None
+
+            page_items = data.get(items_key, [])
+            if not isinstance(page_items, list):
+                print(f"Error: Expected '{items_key}' to be a list in queue {method} response", file=sys.stderr)
+                return 1, None
+
+            continuation = data.get("continuationToken")
+            if continuation:
+                pending = prefetcher.submit(fetch_page, continuation)
+
+            if reducer is not None:
+                reducer(page_items)
+            else:
+                merged_items.extend(page_items)
+
+            last_page = data
+            if not continuation:
+                break
 
     if last_page is None:
         return 1, None
 
     merged = {k: v for k, v in last_page.items() if k not in {items_key, "continuationToken"}}
-    merged[items_key] = merged_items
+    if reducer is None:
+        merged[items_key] = merged_items
     return 0, merged
 
 
@@ -158,45 +375,93 @@ def get_task_definition(task_id: str) -> Optional[dict[str, Any]]:
     return data
 
 
+def get_actions_cache_path(root_url: str, task_group_id: str) -> Path:
+    """Path of the cached actions.json for a task group on a given deployment."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha256(f"{root_url}\n{task_group_id}".encode()).hexdigest()
+    return Path(cache_home) / "tc-actions" / f"{key}.json"
+
+
+def read_actions_cache(cache_path: Path) -> Optional[dict[str, Any]]:
+    """Return cached actions.json if it exists and is within the TTL."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > ACTIONS_CACHE_TTL_SECONDS:
+            return None
+        data = json_loads(cache_path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_actions_cache(cache_path: Path, data: dict[str, Any]) -> None:
+    """Atomically write actions.json to the cache; failures are ignored."""
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="wb", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp_name = f.name
+            f.write(json_dumps(data))
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if tmp_name:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
 def get_actions_json(task_group_id: str) -> Optional[dict[str, Any]]:
     """
     Fetch actions.json from the decision task of a task group.
 
     The actions.json artifact contains all available in-tree actions
-    like confirm-failures, retrigger-multiple, backfill, etc.
+    like confirm-failures, retrigger-multiple, backfill, etc. Responses are
+    cached on disk for ACTIONS_CACHE_TTL_SECONDS so repeated actions against
+    the same task group skip the download.
     """
-    root_url = os.environ.get("TASKCLUSTER_ROOT_URL", DEFAULT_TASKCLUSTER_ROOT_URL).rstrip("/")
+    root_url = _TASKCLUSTER_ENV["TASKCLUSTER_ROOT_URL"].rstrip("/")
     url = f"{root_url}/api/queue/v1/task/{task_group_id}/artifacts/public/actions.json"
 
+    cache_path = get_actions_cache_path(root_url, task_group_id)
+    cached = read_actions_cache(cache_path)
+    if cached is not None:
+        return cached
+
     try:
-        result = subprocess.run(
-            ["curl", "-sL", url],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=False,
-        )
-        if result.returncode != 0:
-            print(f"Error fetching actions.json: {result.stderr}", file=sys.stderr)
-            return None
-        return json.loads(result.stdout)
-    except subprocess.TimeoutExpired:
+        status, body = http_get(url)
+    except TimeoutError:
         print("Error: Timeout fetching actions.json", file=sys.stderr)
         return None
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Error fetching actions.json: {e}", file=sys.stderr)
+        return None
+
+    if status != 200:
+        print(f"Error fetching actions.json: HTTP {status}", file=sys.stderr)
+        return None
+
+    try:
+        data = json_loads(body)
     except json.JSONDecodeError as e:
         print(f"Error parsing actions.json: {e}", file=sys.stderr)
         return None
-    except Exception as e:
-        print(f"Error fetching actions.json: {e}", file=sys.stderr)
-        return None
+
+    # Only cache real actions documents, not error responses
+    if isinstance(data, dict) and isinstance(data.get("actions"), list):
+        write_actions_cache(cache_path, data)
+    return data
 
 
-def find_action(actions_json: dict[str, Any], action_name: str) -> Optional[dict[str, Any]]:
-    """Find a specific action by name in actions.json."""
+def index_actions(actions_json: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Build a name -> action lookup for actions.json (first definition wins)."""
+    by_name: dict[str, dict[str, Any]] = {}
     for action in actions_json.get("actions", []):
-        if action.get("name") == action_name:
-            return action
-    return None
+        by_name.setdefault(action.get("name"), action)
+    return by_name
+
+
+def find_action(actions_by_name: dict[str, dict[str, Any]], action_name: str) -> Optional[dict[str, Any]]:
+    """Find a specific action by name in an index built by index_actions()."""
+    return actions_by_name.get(action_name)
 
 
 def trigger_action(
@@ -232,7 +497,7 @@ def trigger_action(
         print(f"Error: Could not fetch actions.json for task group {task_group_id}", file=sys.stderr)
         return 1
 
-    action = find_action(actions_json, action_name)
+    action = find_action(index_actions(actions_json), action_name)
     if not action:
         print(f"Error: Action '{action_name}' not found in actions.json", file=sys.stderr)
         print("Available actions:", file=sys.stderr)
@@ -257,49 +522,37 @@ def trigger_action(
         },
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(payload, f)
-        payload_file = f.name
-
-    try:
-        print(f"# Triggering action: {action_name}", file=sys.stderr)
-        print(f"# Hook: {hook_group_id}/{hook_id}", file=sys.stderr)
-        print(f"# Task: {task_id}", file=sys.stderr)
-        print(f"# Task Group: {task_group_id}", file=sys.stderr)
-
-        env = os.environ.copy()
-        if "TASKCLUSTER_ROOT_URL" not in env:
-            env["TASKCLUSTER_ROOT_URL"] = DEFAULT_TASKCLUSTER_ROOT_URL
-
-        cmd = ["taskcluster", "api", "hooks", "triggerHook", hook_group_id, hook_id]
+    print(f"# Triggering action: {action_name}", file=sys.stderr)
+    print(f"# Hook: {hook_group_id}/{hook_id}", file=sys.stderr)
+    print(f"# Task: {task_id}", file=sys.stderr)
+    print(f"# Task Group: {task_group_id}", file=sys.stderr)
 
-        with open(payload_file) as f:
-            result = subprocess.run(
-                cmd, stdin=f, capture_output=True, text=True, check=False, env=env
-            )
+    cmd = ["taskcluster", "api", "hooks", "triggerHook", hook_group_id, hook_id]
 
-        if result.returncode != 0:
-            print(f"Error triggering hook: {result.stderr}", file=sys.stderr)
-            return result.returncode
+    # Feed the payload over stdin directly rather than via a temp file.
+    result = subprocess.run(
+        cmd, input=json_dumps(payload), capture_output=True, check=False, env=_TASKCLUSTER_ENV
+    )
 
-        if result.stdout.strip():
-            try:
-                data = json.loads(result.stdout)
-                print(json.dumps(data, indent=2))
-                new_task_id = data.get("status", {}).get("taskId") or data.get("taskId")
-                if new_task_id:
-                    print(f"\n# New task created: {new_task_id}", file=sys.stderr)
-                    root_url = env.get("TASKCLUSTER_ROOT_URL", DEFAULT_TASKCLUSTER_ROOT_URL).rstrip("/")
-                    print(f"# URL: {root_url}/tasks/{new_task_id}", file=sys.stderr)
-            except json.JSONDecodeError:
-                print("Error: Hook response was not valid JSON", file=sys.stderr)
-                print(result.stdout.strip(), file=sys.stderr)
-                return 1
+    if result.returncode != 0:
+        print(f"Error triggering hook: {result.stderr.decode('utf-8', 'replace')}", file=sys.stderr)
+        return result.returncode
 
-        return 0
+    if result.stdout.strip():
+        try:
+            data = json_loads(result.stdout)
+            print_json(data)
+            new_task_id = data.get("status", {}).get("taskId") or data.get("taskId")
+            if new_task_id:
+                print(f"\n# New task created: {new_task_id}", file=sys.stderr)
+                root_url = _TASKCLUSTER_ENV["TASKCLUSTER_ROOT_URL"].rstrip("/")
+                print(f"# URL: {root_url}/tasks/{new_task_id}", file=sys.stderr)
+        except json.JSONDecodeError:
+            print("Error: Hook response was not valid JSON", file=sys.stderr)
+            print(result.stdout.decode("utf-8", "replace").strip(), file=sys.stderr)
+            return 1
 
-    finally:
-        os.unlink(payload_file)
+    return 0
 
 
 def cmd_artifacts(task_id: str, run: Optional[int] = None) -> int:
@@ -313,7 +566,7 @@ def cmd_artifacts(task_id: str, run: Optional[int] = None) -> int:
         code, data = fetch_paginated_queue("listLatestArtifacts", [task_id], "artifacts")
     if code != 0 or data is None:
         return code if code != 0 else 1
-    print(json.dumps(data, indent=2))
+    print_json(data)
     return 0
 
 
@@ -325,30 +578,31 @@ def cmd_group_status(group_id: str) -> int:
     if meta_code != 0 or not isinstance(meta, dict):
         return meta_code if meta_code != 0 else 1
 
-    list_code, tasks_data = fetch_paginated_queue("listTaskGroup", [group_id], "tasks")
+    state_counts: Counter[str] = Counter()
+    total_tasks = 0
+
+    def task_state(task: Any) -> str:
+        status = task.get("status") if isinstance(task, dict) else None
+        return status.get("state", "unknown") if isinstance(status, dict) else "unknown"
+
+    def count_states(tasks: list[Any]) -> None:
+        nonlocal total_tasks
+        total_tasks += len(tasks)
+        state_counts.update(map(task_state, tasks))
+
+    list_code, tasks_data = fetch_paginated_queue("listTaskGroup", [group_id], "tasks", reducer=count_states)
     if list_code != 0 or tasks_data is None:
         return list_code if list_code != 0 else 1
 
-    tasks = tasks_data.get("tasks", [])
-    state_counts: dict[str, int] = {}
-    if isinstance(tasks, list):
-        for task in tasks:
-            state = "unknown"
-            if isinstance(task, dict):
-                status = task.get("status", {})
-                if isinstance(status, dict):
-                    state = status.get("state", "unknown")
-            state_counts[state] = state_counts.get(state, 0) + 1
-
     result = {
         "taskGroupId": group_id,
         "taskGroup": meta,
         "taskSummary": {
-            "totalTasks": len(tasks) if isinstance(tasks, list) else 0,
+            "totalTasks": total_tasks,
             "stateCounts": state_counts,
         },
     }
-    print(json.dumps(result, indent=2))
+    print_json(result)
     return 0
 
 
@@ -383,7 +637,7 @@ def cmd_action_list(task_id: str) -> int:
         }
         for action in actions_json.get("actions", [])
     ]
-    print(json.dumps(actions_list, indent=2))
+    print_json(actions_list)
     return 0
 
 
@@ -420,7 +674,7 @@ def cmd_action(task_id: str, action_name: str, input_json: Optional[str] = None)
     input_data = None
     if input_json:
         try:
-            input_data = json.loads(input_json)
+            input_data = json_loads(input_json)
         except json.JSONDecodeError as e:
             print(f"Error parsing input JSON: {e}", file=sys.stderr)
             return 1
@@ -461,16 +715,19 @@ This script handles the rest:
     )
     artifacts_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
     artifacts_parser.add_argument('--run', type=int, help='Specific run number')
+    artifacts_parser.set_defaults(func=lambda args: cmd_artifacts(args.task_id, args.run))
 
     group_status_parser = subparsers.add_parser(
         'group-status', help='Get task group status with structured state count summary'
     )
     group_status_parser.add_argument('group_id', help='Task Group ID or URL')
+    group_status_parser.set_defaults(func=lambda args: cmd_group_status(args.group_id))
 
     retrigger_parser = subparsers.add_parser(
         'retrigger', help='Retrigger task via in-tree action (preserves dependencies)'
     )
     retrigger_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
+    retrigger_parser.set_defaults(func=lambda args: cmd_retrigger(args.task_id))
 
     retrigger_multiple_parser = subparsers.add_parser(
         'retrigger-multiple', help='Retrigger a task N times via in-tree action'
@@ -480,21 +737,25 @@ This script handles the rest:
         '--times', '-n', type=int, default=5,
         help='Number of times to retrigger (default: 5)'
     )
+    retrigger_multiple_parser.set_defaults(func=lambda args: cmd_retrigger_multiple(args.task_id, args.times))
 
     confirm_failures_parser = subparsers.add_parser(
         'confirm-failures', help='Re-run failing tests to confirm intermittent or regression'
     )
     confirm_failures_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
+    confirm_failures_parser.set_defaults(func=lambda args: cmd_confirm_failures(args.task_id))
 
     backfill_parser = subparsers.add_parser(
         'backfill', help='Run test on previous pushes to find regression range'
     )
     backfill_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
+    backfill_parser.set_defaults(func=lambda args: cmd_backfill(args.task_id))
 
     action_list_parser = subparsers.add_parser(
         'action-list', help='List available in-tree actions for a task'
     )
     action_list_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
+    action_list_parser.set_defaults(func=lambda args: cmd_action_list(args.task_id))
 
     action_parser = subparsers.add_parser(
         'action', help='Trigger any in-tree action by name'
@@ -502,6 +763,7 @@ This script handles the rest:
     action_parser.add_argument('task_id', help='Task ID or Taskcluster URL')
     action_parser.add_argument('action_name', help='Name of the action to trigger')
     action_parser.add_argument('--input', help='JSON input for the action')
+    action_parser.set_defaults(func=lambda args: cmd_action(args.task_id, args.action_name, args.input))
 
     args = parser.parse_args()
 
@@ -509,24 +771,7 @@ This script handles the rest:
         parser.print_help()
         return 1
 
-    if args.command == 'artifacts':
-        return cmd_artifacts(args.task_id, args.run)
-    elif args.command == 'group-status':
-        return cmd_group_status(args.group_id)
-    elif args.command == 'retrigger':
-        return cmd_retrigger(args.task_id)
-    elif args.command == 'retrigger-multiple':
-        return cmd_retrigger_multiple(args.task_id, args.times)
-    elif args.command == 'confirm-failures':
-        return cmd_confirm_failures(args.task_id)
-    elif args.command == 'backfill':
-        return cmd_backfill(args.task_id)
-    elif args.command == 'action-list':
-        return cmd_action_list(args.task_id)
-    elif args.command == 'action':
-        return cmd_action(args.task_id, args.action_name, args.input)
-
-    return 1
+    return args.func(args)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["treeherder-client", "requests"]
+# dependencies = ["treeherder-client", "requests", "requests-cache", "orjson"]
 # ///
 """
 Query and manage Treeherder job classifications.
@@ -15,13 +15,163 @@ Sheriffs classify job failures to help distinguish:
 This script allows querying classifications for jobs.
 """
 
+from __future__ import annotations
+
 import argparse
 import json
+import os
 import sys
-from typing import Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Run with plain python3 instead of uv; fall back to json
+    orjson = None
+
+# requests and thclient (which pulls in requests) are imported where they are
+# used, so --help and argument errors don't pay for loading the HTTP stack.
+if TYPE_CHECKING:
+    import requests
+    from thclient import TreeherderClient
+
+
+TREEHERDER_URL = "https://treeherder.mozilla.org"
+
+# (connect, read) timeouts in seconds. A short connect timeout lets the retry
+# policy move on from an unreachable node instead of waiting out TCP SYN retries.
+TREEHERDER_TIMEOUT = (3.05, 30)
+
+# On-disk response cache lifetimes per Treeherder endpoint (requests-cache URL
+# globs). A revision's push never changes once created; jobs and notes change
+# as sheriffs classify, so they are only reused within a short polling window.
+# Once an entry expires it is kept and revalidated with If-None-Match, so a
+# repeated poll of an unchanged jobs list costs a bodiless 304 rather than a
+# full download. Anything else is not cached.
+CACHE_EXPIRE_AFTER = {
+    "treeherder.mozilla.org/api/project/*/push/": timedelta(days=7),
+    "treeherder.mozilla.org/api/project/*/jobs/": timedelta(seconds=10),
+    "treeherder.mozilla.org/api/project/*/note/": timedelta(seconds=10),
+}
+
+# Jobs pages fetched concurrently once a push overflows the first page
+JOBS_PARALLEL_PAGES = 4
+
+# Upper bound on jobs pages per push (100k jobs at MAX_COUNT), in case the
+# server keeps returning full pages
+JOBS_MAX_PAGES = 50
+
+_session: Optional[requests.Session] = None
+_client: Optional[TreeherderClient] = None
+_cache_enabled = True
+
+
+def get_cache_path() -> Path:
+    """Location of the on-disk response cache (sqlite)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "treeherder" / "classification"
+
+
+def is_cacheable(response: requests.Response) -> bool:
+    """Don't cache empty push lookups; the revision may not be pushed yet."""
+    if "/push/" not in response.url:
+        return True
+    try:
+        data = json_loads(response.content)
+    except ValueError:
+        return False
+    # Push detail responses (push/<id>/) have no results list
+    return "results" not in data or bool(data["results"])
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared Treeherder HTTP session.
+
+    Connections are kept alive and pooled across requests, and transient
+    failures (429/5xx) on GETs are retried with backoff. Unless disabled with
+    --no-cache, responses are cached on disk per CACHE_EXPIRE_AFTER.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from thclient import TreeherderClient
+        from urllib3.util.retry import Retry
+
+        if _cache_enabled:
+            import requests_cache
+
+            _session = requests_cache.CachedSession(
+                str(get_cache_path()),
+                backend="sqlite",
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after=CACHE_EXPIRE_AFTER,
+                filter_fn=is_cacheable,
+            )
+        else:
+            _session = requests.Session()
+
+        retry = Retry(
+            total=3,
+            connect=2,
+            read=1,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+        _session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        _session.headers.update(TreeherderClient.REQUEST_HEADERS)
+        _session.headers["User-Agent"] = "agent-skills-treeherder-classification"
+    return _session
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when available (raises ValueError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-import requests
-from thclient import TreeherderClient
+
+def print_json(data: Any) -> None:
+    """Pretty-print JSON to stdout, writing orjson's bytes straight to the buffer."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json.dumps(data, indent=2))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    buffer.flush()
+
+
+def get_json(client: TreeherderClient, endpoint: str, project: Optional[str] = None, **params) -> dict:
+    """
+    Drop-in for TreeherderClient._get_json that decodes with orjson.
+
+    The jobs listing for a push is by far the largest payload we fetch, and
+    orjson parses it several times faster than requests' stdlib decoder.
+    """
+    url = client._get_endpoint_url(endpoint, project=project)
+    response = client.session.get(url, params=params, timeout=client.timeout)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+def get_client() -> TreeherderClient:
+    """Get the shared TreeherderClient, which sends requests through the shared session."""
+    global _client
+    if _client is None:
+        from thclient import TreeherderClient
+
+        _client = TreeherderClient()
+        _client.session = get_session()
+        _client.timeout = TREEHERDER_TIMEOUT
+        _client._get_json = partial(get_json, _client)
+    return _client
 
 
 # Treeherder classification IDs
@@ -35,6 +185,15 @@ CLASSIFICATION_NAMES = {
     7: "autoclassified intermittent",
 }
 
+# IDs are contiguous, so names are looked up by index (slot 0 is unused)
+_CLASSIFICATION_NAME_TABLE = (None, *(CLASSIFICATION_NAMES[i] for i in range(1, len(CLASSIFICATION_NAMES) + 1)))
+
+# Job results that count as failures in a push summary
+FAILED_RESULTS = frozenset({"testfailed", "busted"})
+
+# Jobs listed per classification in the text summary
+SUMMARY_JOBS_SHOWN = 5
+
 
 def get_job_by_task_id(
     client: TreeherderClient,
@@ -42,31 +201,174 @@ def get_job_by_task_id(
     repo: str = "autoland",
 ) -> Optional[dict]:
     """Find a Treeherder job by Taskcluster task ID."""
+    import requests
+
     # Search across common repos if not found
     repos_to_try = [repo] if repo else ["autoland", "mozilla-central", "try"]
 
-    for r in repos_to_try:
+    def find_in_repo(r: str) -> list:
         try:
             data = client._get_json(
                 client.JOBS_ENDPOINT,
                 project=r,
                 task_id=task_id,
             )
-            jobs = data.get("results", [])
+            return data.get("results", [])
+        except (requests.RequestException, ValueError):
+            # HTTP/connection errors or an undecodable body: not found in this repo
+            return []
+
+    # Query all candidate repos concurrently; results are still checked in
+    # priority order so the first repo with a match wins.
+    with ThreadPoolExecutor(max_workers=len(repos_to_try)) as pool:
+        for r, jobs in zip(repos_to_try, pool.map(find_in_repo, repos_to_try)):
             if jobs:
                 return {"job": jobs[0], "repo": r}
-        except Exception:
-            continue
 
     return None
 
 
+def get_push_jobs(
+    client: TreeherderClient,
+    repo: str,
+    push_id: int,
+    **filters,
+) -> list[dict]:
+    """
+    Fetch every job in a push, optionally narrowed by server-side filters.
+
+    Pages are requested at Treeherder's maximum size. Busy pushes can exceed
+    one page, and the API doesn't report a total, so once the first page
+    comes back full the following pages are fetched a few at a time in
+    parallel until a short page marks the end. Paging also stops, with a
+    warning, if a page repeats the previous one (offset ignored) or after
+    JOBS_MAX_PAGES pages.
+    """
+    page_size = client.MAX_COUNT
+
+    def fetch_page(offset: int) -> list:
+        # return_type=list sends each job as a row of values plus one shared
+        # list of property names, instead of repeating every key per job
+        data = client._get_json(
+            client.JOBS_ENDPOINT,
+            project=repo,
+            push_id=push_id,
+            count=page_size,
+            offset=offset,
+            return_type="list",
+            **filters,
+        )
+        rows = data.get("results", [])
+        names = data.get("job_property_names")
+        if names is None:
+            return rows
+        return [dict(zip(names, row)) for row in rows]
+
+    jobs = fetch_page(0)
+    if len(jobs) < page_size:
+        return jobs
+
+    def stop(reason: str) -> list[dict]:
+        print(f"Warning: stopped paging jobs for push {push_id} at {len(jobs)} jobs: {reason}", file=sys.stderr)
+        return jobs
+
+    first_id = jobs[0].get("id")
+    pages = 1
+    offset = page_size
+    with ThreadPoolExecutor(max_workers=JOBS_PARALLEL_PAGES) as pool:
+        while True:
+            offsets = [offset + i * page_size for i in range(JOBS_PARALLEL_PAGES)]
+            for page in pool.map(fetch_page, offsets):
+                if page and page[0].get("id") == first_id:
+                    return stop("Treeherder repeated the previous page")
+                first_id = page[0].get("id") if page else None
+                jobs.extend(page)
+                pages += 1
+                if len(page) < page_size:
+                    return jobs
+                if pages >= JOBS_MAX_PAGES:
+                    return stop(f"reached {JOBS_MAX_PAGES} pages")
+            offset = offsets[-1] + page_size
+
+
+def get_push_failures(
+    client: TreeherderClient,
+    repo: str,
+    push_id: int,
+) -> list[dict]:
+    """
+    Fetch a push's failed jobs, filtering by result on the server.
+
+    Each result value is its own request, so the pages are merged back into
+    the push's job ID order (what a single unfiltered scan returns).
+    """
+    with ThreadPoolExecutor(max_workers=len(FAILED_RESULTS)) as pool:
+        pages = pool.map(lambda result: get_push_jobs(client, repo, push_id, result=result), sorted(FAILED_RESULTS))
+        return sorted((job for page in pages for job in page), key=lambda job: job["id"])
+
+
+def get_jobs_indexed_by_task(
+    client: TreeherderClient,
+    repo: str,
+    push_id: int,
+) -> dict[str, dict]:
+    """Fetch every job in a push once and index them by Taskcluster task ID."""
+    jobs = get_push_jobs(client, repo, push_id)
+    return {job["task_id"]: job for job in jobs if job.get("task_id")}
+
+
+def get_jobs_by_task_ids(
+    client: TreeherderClient,
+    task_ids: list[str],
+    repo: Optional[str] = None,
+) -> dict[str, Optional[dict]]:
+    """
+    Find Treeherder jobs for many Taskcluster task IDs.
+
+    Tasks are usually from the same push, so the first task is looked up
+    individually and then its whole push is fetched in one request; later
+    tasks are resolved from that index and only fall back to a per-task
+    lookup (which indexes another push) when they are not in any push seen
+    so far.
+    """
+    import requests
+
+    index: dict[str, dict] = {}
+    seen_pushes: set[tuple[str, int]] = set()
+    results: dict[str, Optional[dict]] = {}
+
+    for task_id in task_ids:
+        if task_id in index:
+            results[task_id] = index[task_id]
+            continue
+
+        result = get_job_by_task_id(client, task_id, repo)
+        results[task_id] = result
+        if not result:
+            continue
+
+        push_key = (result["repo"], result["job"].get("push_id"))
+        if push_key[1] is not None and push_key not in seen_pushes:
+            seen_pushes.add(push_key)
+            try:
+                push_jobs = get_jobs_indexed_by_task(client, *push_key)
+            except (requests.RequestException, ValueError) as e:
+                print(f"Warning: Could not fetch jobs for push {push_key[1]}: {e}", file=sys.stderr)
+                continue
+            for tid, job in push_jobs.items():
+                index.setdefault(tid, {"job": job, "repo": push_key[0]})
+
+    return results
+
+
 def get_job_by_id(
     client: TreeherderClient,
     job_id: int,
     repo: str,
 ) -> Optional[dict]:
     """Get a Treeherder job by job ID."""
+    import requests
+
     try:
         data = client._get_json(
             client.JOBS_ENDPOINT,
@@ -76,12 +378,24 @@ def get_job_by_id(
         jobs = data.get("results", [])
         if jobs:
             return {"job": jobs[0], "repo": repo}
-    except Exception:
+    except (requests.RequestException, ValueError):
         pass
 
     return None
 
 
+@lru_cache(maxsize=32)
+def _unknown_classification_name(class_id: Any) -> str:
+    return f"unknown ({class_id})"
+
+
+def classification_name(class_id: Any) -> str:
+    """Human-readable name for a failure classification ID."""
+    if type(class_id) is int and 0 < class_id < len(_CLASSIFICATION_NAME_TABLE):
+        return _CLASSIFICATION_NAME_TABLE[class_id]
+    return _unknown_classification_name(class_id)
+
+
 def get_job_classification(job: dict) -> dict:
     """Extract classification information from a job."""
     class_id = job.get("failure_classification_id", 1)
@@ -93,7 +407,7 @@ def get_job_classification(job: dict) -> dict:
         "result": job.get("result"),
         "state": job.get("state"),
         "failure_classification_id": class_id,
-        "failure_classification_name": CLASSIFICATION_NAMES.get(class_id, f"unknown ({class_id})"),
+        "failure_classification_name": classification_name(class_id),
         "who": job.get("who"),  # Who ran the job
     }
 
@@ -104,23 +418,131 @@ def get_job_notes(job_id: int, repo: str) -> list:
 
     Uses direct API call since treeherder-client doesn't expose this.
     """
-    url = f"https://treeherder.mozilla.org/api/project/{repo}/note/?job_id={job_id}"
+    url = f"{TREEHERDER_URL}/api/project/{repo}/note/"
 
     try:
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, params={"job_id": job_id}, timeout=TREEHERDER_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
     except Exception as e:
         print(f"Warning: Could not fetch notes: {e}", file=sys.stderr)
         return []
 
 
+def get_notes_for_push(repo: str, revision: str) -> dict[Any, list]:
+    """
+    Get all notes on a push's jobs in one request, bucketed by job.
+
+    Notes are keyed by job ID and, when the API includes it, by task ID too.
+    """
+    url = f"{TREEHERDER_URL}/api/project/{repo}/note/push_notes/"
+
+    try:
+        response = get_session().get(url, params={"revision": revision}, timeout=TREEHERDER_TIMEOUT)
+        response.raise_for_status()
+        notes = json_loads(response.content)
+    except Exception as e:
+        print(f"Warning: Could not fetch notes: {e}", file=sys.stderr)
+        return {}
+
+    by_job: dict[Any, list] = {}
+    for note in notes:
+        job = note.get("job") or {}
+        for key in {note.get("job_id"), job.get("id"), job.get("task_id")} - {None}:
+            by_job.setdefault(key, []).append(note)
+    return by_job
+
+
+def format_note(note: dict) -> dict:
+    """Trim a Treeherder note to the fields we report."""
+    class_id = note.get("failure_classification_id")
+    return {
+        "id": note.get("id"),
+        "text": note.get("text"),
+        "failure_classification_id": class_id,
+        "failure_classification_name": (
+            note.get("failure_classification_name") or classification_name(class_id if class_id is not None else 1)
+        ),
+        "created": note.get("created"),
+    }
+
+
+def build_classification(result: dict, include_notes: bool) -> dict:
+    """Classification details for a found job, optionally with sheriff notes."""
+    job = result["job"]
+    repo = result["repo"]
+
+    classification = get_job_classification(job)
+    classification["repo"] = repo
+    classification["treeherder_url"] = (
+        f"https://treeherder.mozilla.org/jobs?repo={repo}"
+        f"&selectedJobId={job.get('id')}"
+    )
+
+    # Get notes if requested
+    if include_notes:
+        notes = get_job_notes(job.get("id"), repo)
+        classification["notes"] = [format_note(n) for n in notes]
+
+    return classification
+
+
+def format_classification(classification: dict) -> list[str]:
+    """Format a classification as human-readable lines."""
+    lines = [
+        f"Job: {classification['job_type_name']}",
+        f"Result: {classification['result']} ({classification['state']})",
+        f"Classification: {classification['failure_classification_name']} (id={classification['failure_classification_id']})",
+        f"Treeherder: {classification['treeherder_url']}",
+    ]
+
+    if classification.get("notes"):
+        lines.append("\nNotes:")
+        lines.extend(f"  - [{note['failure_classification_name']}] {note['text']}" for note in classification["notes"])
+
+    return lines
+
+
+def cmd_get_batch(args, client: TreeherderClient) -> int:
+    """Get classifications for every task ID listed in a file."""
+    try:
+        with open(args.task_ids) as f:
+            task_ids = list(dict.fromkeys(line.strip() for line in f if line.strip()))
+    except OSError as e:
+        print(f"Error reading {args.task_ids}: {e}", file=sys.stderr)
+        return 1
+
+    results = get_jobs_by_task_ids(client, task_ids, args.repo)
+
+    classifications = []
+    missing = []
+    for task_id in task_ids:
+        result = results.get(task_id)
+        if result:
+            classifications.append(build_classification(result, args.include_notes))
+        else:
+            missing.append(task_id)
+
+    if args.json:
+        print_json({"classifications": classifications, "not_found": missing})
+    else:
+        blocks = ["\n".join(format_classification(c)) for c in classifications]
+        if blocks:
+            sys.stdout.write("\n\n".join(blocks) + "\n")
+    for task_id in missing:
+        print(f"Job not found for task ID: {task_id}", file=sys.stderr)
+
+    return 1 if missing else 0
+
+
 def cmd_get(args) -> int:
     """Get classification for a job."""
-    client = TreeherderClient()
+    client = get_client()
 
     # Find the job
-    if args.task_id:
+    if args.task_ids:
+        return cmd_get_batch(args, client)
+    elif args.task_id:
         result = get_job_by_task_id(client, args.task_id, args.repo)
         if not result:
             print(f"Job not found for task ID: {args.task_id}", file=sys.stderr)
@@ -134,112 +556,125 @@ def cmd_get(args) -> int:
             print(f"Job not found: {args.job_id} in {args.repo}", file=sys.stderr)
             return 1
     else:
-        print("Either --task-id or --job-id is required", file=sys.stderr)
+        print("Either --task-id, --task-ids or --job-id is required", file=sys.stderr)
         return 1
 
-    job = result["job"]
-    repo = result["repo"]
-
-    classification = get_job_classification(job)
-    classification["repo"] = repo
-    classification["treeherder_url"] = (
-        f"https://treeherder.mozilla.org/jobs?repo={repo}"
-        f"&selectedJobId={job.get('id')}"
-    )
-
-    # Get notes if requested
-    if args.include_notes:
-        notes = get_job_notes(job.get("id"), repo)
-        classification["notes"] = [
-            {
-                "id": n.get("id"),
-                "text": n.get("text"),
-                "failure_classification_id": n.get("failure_classification_id"),
-                "failure_classification_name": CLASSIFICATION_NAMES.get(
-                    n.get("failure_classification_id", 1), "unknown"
-                ),
-                "created": n.get("created"),
-            }
-            for n in notes
-        ]
+    classification = build_classification(result, args.include_notes)
 
     if args.json:
-        print(json.dumps(classification, indent=2))
+        print_json(classification)
     else:
-        print(f"Job: {classification['job_type_name']}")
-        print(f"Result: {classification['result']} ({classification['state']})")
-        print(f"Classification: {classification['failure_classification_name']} (id={classification['failure_classification_id']})")
-        print(f"Treeherder: {classification['treeherder_url']}")
-
-        if args.include_notes and classification.get("notes"):
-            print("\nNotes:")
-            for note in classification["notes"]:
-                print(f"  - [{note['failure_classification_name']}] {note['text']}")
+        sys.stdout.write("\n".join(format_classification(classification)) + "\n")
 
     return 0
 
 
 def cmd_summary(args) -> int:
     """Get classification summary for jobs in a push."""
-    client = TreeherderClient()
-
-    # Get push
-    if args.revision:
-        data = client._get_json(
-            client.PUSH_ENDPOINT,
-            project=args.repo,
-            revision=args.revision,
-        )
-        if not data.get("results"):
-            print(f"No push found for revision: {args.revision}", file=sys.stderr)
-            return 1
-        push_id = data["results"][0]["id"]
-    else:
-        push_id = args.push_id
-
-    # Get jobs
-    data = client._get_json(
-        client.JOBS_ENDPOINT,
-        project=args.repo,
-        push_id=push_id,
-    )
-    jobs = data.get("results", [])
-
-    # Filter to failures only
-    failures = [j for j in jobs if j.get("result") in ["testfailed", "busted"]]
+    if not args.revision and not args.push_id:
+        print("Either --revision or --push-id is required", file=sys.stderr)
+        return 1
 
-    if not failures:
+    client = get_client()
+
+    def fetch_notes() -> dict[Any, list]:
+        # Notes for the whole push come from one request keyed by revision
+        revision = args.revision
+        if not revision:
+            try:
+                response = get_session().get(
+                    f"{TREEHERDER_URL}/api/project/{args.repo}/push/{args.push_id}/", timeout=TREEHERDER_TIMEOUT
+                )
+                response.raise_for_status()
+                revision = json_loads(response.content).get("revision")
+            except Exception as e:
+                print(f"Warning: Could not look up push {args.push_id}: {e}", file=sys.stderr)
+        return get_notes_for_push(args.repo, revision) if revision else {}
+
+    # Notes only need the revision or push ID we were given, so fetch them
+    # while the push and its jobs are being resolved.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        notes_future = pool.submit(fetch_notes) if args.include_notes else None
+
+        # Get push
+        if args.revision:
+            data = client._get_json(
+                client.PUSH_ENDPOINT,
+                project=args.repo,
+                revision=args.revision,
+            )
+            if not data.get("results"):
+                print(f"No push found for revision: {args.revision}", file=sys.stderr)
+                return 1
+            push_id = data["results"][0]["id"]
+        else:
+            push_id = args.push_id
+
+        # Get failed jobs
+        jobs = get_push_failures(client, args.repo, push_id)
+        notes_by_job = notes_future.result() if notes_future else {}
+
+    # Group failures by classification in a single pass over the push's jobs.
+    # Text output only counts each classification and names its first few
+    # jobs (with notes), so only JSON output keeps whole jobs.
+    name_of = classification_name
+    keep_jobs = args.json
+    include_notes = args.include_notes
+
+    def notes_for(job: dict) -> list:
+        return [format_note(n) for n in notes_by_job.get(job.get("id")) or notes_by_job.get(job.get("task_id")) or []]
+
+    class_counts: Counter[str] = Counter()
+    by_classification: dict[str, list] = {}
+    for job in jobs:
+        if job.get("result") not in FAILED_RESULTS:
+            continue
+        class_id = job.get("failure_classification_id", 1)
+        class_name = name_of(class_id)
+        class_counts[class_name] += 1
+        bucket = by_classification.setdefault(class_name, [])
+        if keep_jobs:
+            bucket.append(job)
+        elif len(bucket) < SUMMARY_JOBS_SHOWN:
+            name = job.get("job_type_name")
+            if include_notes:
+                name = "".join(
+                    [name or ""]
+                    + [f"\n        [{n['failure_classification_name']}] {n['text']}" for n in notes_for(job)]
+                )
+            bucket.append(name)
+    total_failures = sum(class_counts.values())
+
+    if not total_failures:
         print("No failures found in this push")
         return 0
 
-    # Group by classification
-    by_classification = {}
-    for job in failures:
-        class_id = job.get("failure_classification_id", 1)
-        class_name = CLASSIFICATION_NAMES.get(class_id, f"unknown ({class_id})")
-        by_classification.setdefault(class_name, []).append(job)
+    def summarize_job(job: dict) -> dict:
+        classification = get_job_classification(job)
+        if include_notes:
+            classification["notes"] = notes_for(job)
+        return classification
 
     if args.json:
         result = {
             "push_id": push_id,
             "repo": args.repo,
-            "total_failures": len(failures),
+            "total_failures": total_failures,
             "by_classification": {
-                name: [get_job_classification(j) for j in jobs]
+                name: [summarize_job(j) for j in jobs]
                 for name, jobs in by_classification.items()
             },
         }
-        print(json.dumps(result, indent=2))
+        print_json(result)
     else:
-        print(f"Push {push_id} ({args.repo}): {len(failures)} failure(s)\n")
-        print("By classification:")
-        for class_name in sorted(by_classification.keys()):
-            jobs = by_classification[class_name]
-            print(f"\n  {class_name}: {len(jobs)}")
-            for job in jobs[:5]:  # Show first 5
-                print(f"    - {job.get('job_type_name')}")
-            if len(jobs) > 5:
-                print(f"    ... and {len(jobs) - 5} more")
+        lines = [f"Push {push_id} ({args.repo}): {total_failures} failure(s)\n", "By classification:"]
+        for class_name in sorted(class_counts):
+            count = class_counts[class_name]
+            lines.append(f"\n  {class_name}: {count}")
+            lines.extend(f"    - {name}" for name in by_classification[class_name])
+            if count > SUMMARY_JOBS_SHOWN:
+                lines.append(f"    ... and {count - SUMMARY_JOBS_SHOWN} more")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
@@ -265,6 +700,9 @@ Examples:
   # Get classification by Treeherder job ID
   %(prog)s get --job-id 12345 --repo autoland
 
+  # Classifications for many tasks (fetches each push's jobs once)
+  %(prog)s get --task-ids failed-tasks.txt --json
+
   # Include sheriff notes
   %(prog)s get --task-id fuCPrKG2T62-4YH1tWYa7Q --include-notes
 
@@ -277,18 +715,28 @@ Examples:
 
     # get command
     get_parser = subparsers.add_parser("get", help="Get classification for a job")
+    get_parser.set_defaults(func=cmd_get)
     get_parser.add_argument("--task-id", help="Taskcluster task ID")
+    get_parser.add_argument(
+        "--task-ids", metavar="FILE", help="File of Taskcluster task IDs, one per line (resolved per push)"
+    )
     get_parser.add_argument("--job-id", type=int, help="Treeherder job ID")
     get_parser.add_argument("--repo", help="Repository (autoland, mozilla-central, try)")
     get_parser.add_argument("--include-notes", action="store_true", help="Include sheriff notes")
     get_parser.add_argument("--json", action="store_true", help="JSON output")
+    get_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache")
 
     # summary command
     summary_parser = subparsers.add_parser("summary", help="Classification summary for a push")
+    summary_parser.set_defaults(func=cmd_summary)
     summary_parser.add_argument("--revision", help="Commit revision")
     summary_parser.add_argument("--push-id", type=int, help="Push ID")
     summary_parser.add_argument("--repo", default="autoland", help="Repository (default: autoland)")
+    summary_parser.add_argument(
+        "--include-notes", action="store_true", help="Include sheriff notes (fetched once for the whole push)"
+    )
     summary_parser.add_argument("--json", action="store_true", help="JSON output")
+    summary_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache")
 
     args = parser.parse_args()
 
@@ -296,15 +744,10 @@ Examples:
         parser.print_help()
         return 1
 
-    if args.command == "get":
-        return cmd_get(args)
-    elif args.command == "summary":
-        if not args.revision and not args.push_id:
-            print("Either --revision or --push-id is required", file=sys.stderr)
-            return 1
-        return cmd_summary(args)
+    global _cache_enabled
+    _cache_enabled = not args.no_cache
 
-    return 1
+    return args.func(args)
 
 
 if __name__ == "__main__":
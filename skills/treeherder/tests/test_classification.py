@@ -0,0 +1,116 @@
+"""Tests for scripts/classification.py (run: python -m unittest discover skills/treeherder/tests)."""
+
+import argparse
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import classification  # noqa: E402
+
+# A push's jobs in ID order, with busted and testfailed jobs interleaved
+PUSH_JOBS = [
+    {"id": 1, "job_type_name": "build-linux", "result": "busted", "failure_classification_id": 4},
+    {"id": 2, "job_type_name": "test-a", "result": "testfailed", "failure_classification_id": 4},
+    {"id": 3, "job_type_name": "test-b", "result": "success", "failure_classification_id": 1},
+    {"id": 4, "job_type_name": "build-win", "result": "busted", "failure_classification_id": 4},
+    {"id": 5, "job_type_name": "test-c", "result": "testfailed", "failure_classification_id": 4},
+]
+
+
+class FakeClient:
+    """Stands in for TreeherderClient, answering push and (result-filtered) jobs queries."""
+
+    PUSH_ENDPOINT = "push"
+    JOBS_ENDPOINT = "jobs"
+    MAX_COUNT = 2000
+
+    def _get_json(self, endpoint, project=None, **params):
+        if endpoint == self.PUSH_ENDPOINT:
+            return {"results": [{"id": 7}]}
+        if params.get("offset"):
+            return {"results": []}
+        result = params.get("result")
+        return {"results": [job for job in PUSH_JOBS if result in (None, job["result"])]}
+
+
+class SummaryOrderTest(unittest.TestCase):
+    def setUp(self):
+        self._get_client = classification.get_client
+        classification.get_client = FakeClient
+
+    def tearDown(self):
+        classification.get_client = self._get_client
+
+    def run_summary(self, as_json: bool) -> str:
+        args = argparse.Namespace(revision="abc", push_id=None, repo="try", json=as_json, include_notes=False)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(classification.cmd_summary(args), 0)
+        return out.getvalue()
+
+    def test_failures_keep_push_job_order(self):
+        jobs = classification.get_push_failures(FakeClient(), "try", 7)
+        self.assertEqual([job["id"] for job in jobs], [1, 2, 4, 5])
+
+    def test_text_summary_lists_jobs_in_push_order(self):
+        output = self.run_summary(as_json=False)
+        names = [line.strip()[2:] for line in output.splitlines() if line.strip().startswith("- ")]
+        self.assertEqual(names, ["build-linux", "test-a", "build-win", "test-c"])
+
+    def test_json_summary_lists_jobs_in_push_order(self):
+        output = self.run_summary(as_json=True)
+        data = classification.json_loads(output)
+        jobs = data["by_classification"]["intermittent"]
+        self.assertEqual([job["job_type_name"] for job in jobs], ["build-linux", "test-a", "build-win", "test-c"])
+
+
+class PagingClient:
+    """Jobs endpoint with tiny full pages; `ignore_offset` makes it return page one forever."""
+
+    JOBS_ENDPOINT = "jobs"
+    MAX_COUNT = 2
+
+    def __init__(self, total: int, ignore_offset: bool = False):
+        self.total = total
+        self.ignore_offset = ignore_offset
+        self.requests = 0
+
+    def _get_json(self, endpoint, project=None, **params):
+        self.requests += 1
+        offset = 0 if self.ignore_offset else params["offset"]
+        ids = range(offset, min(offset + params["count"], self.total))
+        return {"results": [{"id": job_id} for job_id in ids]}
+
+
+class PushJobsPagingTest(unittest.TestCase):
+    def fetch(self, client: PagingClient) -> tuple[list, str]:
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err):
+            jobs = classification.get_push_jobs(client, "try", 7)
+        return jobs, err.getvalue()
+
+    def test_reads_pages_until_a_short_page(self):
+        jobs, warnings = self.fetch(PagingClient(total=9))
+        self.assertEqual([job["id"] for job in jobs], list(range(9)))
+        self.assertEqual(warnings, "")
+
+    def test_stops_when_offset_is_ignored(self):
+        client = PagingClient(total=100, ignore_offset=True)
+        jobs, warnings = self.fetch(client)
+        self.assertEqual([job["id"] for job in jobs], [0, 1])
+        self.assertIn("repeated", warnings)
+        self.assertLessEqual(client.requests, 1 + classification.JOBS_PARALLEL_PAGES)
+
+    def test_stops_after_max_pages(self):
+        client = PagingClient(total=10**6)
+        jobs, warnings = self.fetch(client)
+        self.assertEqual(len(jobs), classification.JOBS_MAX_PAGES * client.MAX_COUNT)
+        self.assertIn("pages", warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()
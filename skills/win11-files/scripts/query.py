@@ -10,6 +10,9 @@ and the legacy 24H2-only database (win11_24h2_files.db).
 """
 
 import argparse
+import atexit
+import csv
+import functools
 import sqlite3
 import sys
 from pathlib import Path
@@ -19,12 +22,24 @@ DB_PATHS = [
     Path.home() / "moz_artifacts" / "win11_24h2_files.db",
 ]
 
+# Rows pulled per fetchmany() call when streaming large result sets.
+FETCH_SIZE = 10000
 
+
+@functools.cache
 def get_connection():
+    """Open the first database found, once per process."""
     for db_path in DB_PATHS:
         if db_path.exists():
             conn = sqlite3.connect(db_path)
+            atexit.register(conn.close)
+            # Read-heavy scans: map the file, keep a 256 MB page cache
+            # and sort/group in memory.
+            conn.execute("PRAGMA mmap_size=1073741824")
+            conn.execute("PRAGMA cache_size=-262144")
+            conn.execute("PRAGMA temp_store=MEMORY")
             has_version = _has_version_column(conn)
+            _prepare_database(conn, has_version)
             return conn, db_path, has_version
 
     paths = "\n  ".join(str(p) for p in DB_PATHS)
@@ -38,6 +53,57 @@ def _has_version_column(conn):
     return "version" in columns
 
 
+def _patch_columns(has_version):
+    columns = "kb_number, release_date, build, update_type"
+    return f"version, {columns}" if has_version else columns
+
+
+def _prepare_database(conn, has_version):
+    """Backfill indexes and the builds summary on older databases."""
+    patch_columns = _patch_columns(has_version)
+    try:
+        conn.executescript(f"""
+            CREATE INDEX IF NOT EXISTS idx_files_file_name_date
+                ON files(file_name, release_date);
+            CREATE INDEX IF NOT EXISTS idx_files_file_name_nocase
+                ON files(file_name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_files_build_name
+                ON files(build, file_name, file_version);
+            CREATE INDEX IF NOT EXISTS idx_files_patch
+                ON files({patch_columns});
+            CREATE TABLE IF NOT EXISTS builds_summary AS
+                SELECT {patch_columns}, COUNT(*) AS file_count
+                FROM files
+                GROUP BY {patch_columns};
+            PRAGMA optimize;
+        """)
+    except sqlite3.OperationalError:
+        # Read-only database: queries still work, just without the extras.
+        pass
+
+
+def _like_escape(text):
+    """Escape LIKE wildcards so text matches literally."""
+    return (
+        text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+
+
+def _builds_source(conn, has_version):
+    """Return the per-patch file counts: the summary table when present."""
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+        "AND name = 'builds_summary'"
+    )
+    if cursor.fetchone():
+        return "builds_summary"
+    patch_columns = _patch_columns(has_version)
+    return (
+        f"(SELECT {patch_columns}, COUNT(*) AS file_count "
+        f"FROM files GROUP BY {patch_columns})"
+    )
+
+
 def _version_filter(has_version, version, prefix="AND"):
     if not has_version or not version:
         return "", []
@@ -49,20 +115,31 @@ def cmd_search(args):
     conn, db_path, has_version = get_connection()
     cursor = conn.cursor()
 
-    pattern = f"%{args.pattern}%" if not args.exact else args.pattern
+    # A literal prefix ("name%") lets SQLite answer the case-insensitive
+    # LIKE with a range scan on the NOCASE file_name index.
+    escape = " ESCAPE '\\'" if args.prefix or args.suffix else ""
+    if args.exact:
+        pattern = args.pattern
+    elif args.prefix:
+        pattern = f"{_like_escape(args.pattern)}%"
+    elif args.suffix:
+        pattern = f"%{_like_escape(args.pattern)}"
+    else:
+        pattern = f"%{args.pattern}%"
     ver_clause, ver_params = _version_filter(has_version, args.version)
 
     query = f"""
         SELECT DISTINCT file_name, file_version, kb_number, build, release_date
         FROM files
-        WHERE file_name LIKE ? {ver_clause}
+        WHERE file_name LIKE ?{escape} {ver_clause}
         ORDER BY file_name, build
     """
     if args.limit:
         query += f" LIMIT {args.limit}"
 
+    cursor.arraysize = FETCH_SIZE
     cursor.execute(query, [pattern] + ver_params)
-    rows = cursor.fetchall()
+    rows = cursor.fetchmany()
 
     if not rows:
         print(f"No files found matching '{args.pattern}'")
@@ -70,11 +147,16 @@ def cmd_search(args):
 
     print(f"{'File Name':<50} {'Version':<25} {'KB':<12} {'Build':<15} {'Date'}")
     print("-" * 120)
-    for row in rows:
-        print(f"{row[0]:<50} {row[1]:<25} {row[2]:<12} {row[3]:<15} {row[4]}")
+    total = 0
+    while rows:
+        sys.stdout.write("".join(
+            f"{row[0]:<50} {row[1]:<25} {row[2]:<12} {row[3]:<15} {row[4]}\n"
+            for row in rows
+        ))
+        total += len(rows)
+        rows = cursor.fetchmany()
 
-    print(f"\nTotal: {len(rows)} entries")
-    conn.close()
+    print(f"\nTotal: {total} entries")
 
 
 def cmd_history(args):
@@ -100,17 +182,18 @@ def cmd_history(args):
     print(f"{'KB':<12} {'Release Date':<15} {'Build':<15} {'File Version':<30} {'Type'}")
     print("-" * 100)
 
+    lines = []
     prev_version = None
     for row in rows:
         marker = " *" if prev_version and row[3] != prev_version else ""
-        print(
+        lines.append(
             f"{row[0]:<12} {row[1]:<15} {row[2]:<15} "
-            f"{row[3]:<30} {row[4]}{marker}"
+            f"{row[3]:<30} {row[4]}{marker}\n"
         )
         prev_version = row[3]
+    sys.stdout.write("".join(lines))
 
     print(f"\nTotal: {len(rows)} entries (* = version changed)")
-    conn.close()
 
 
 def cmd_diff(args):
@@ -119,38 +202,48 @@ def cmd_diff(args):
     cursor = conn.cursor()
     ver_clause, ver_params = _version_filter(has_version, args.version)
 
-    cursor.execute(f"""
-        SELECT file_name, file_version FROM files
-        WHERE build = ? {ver_clause}
-    """, [args.build1] + ver_params)
-    build1_files = {row[0]: row[1] for row in cursor.fetchall()}
+    for build in (args.build1, args.build2):
+        cursor.execute(
+            f"SELECT 1 FROM files WHERE build = ? {ver_clause} LIMIT 1",
+            [build] + ver_params,
+        )
+        if cursor.fetchone() is None:
+            print(f"No files found for build {build}")
+            return
 
+    # One row per file name and build; when a name repeats within a build
+    # the last inserted row wins (the bare column follows MAX(rowid)).
+    # SQLite has no FULL OUTER JOIN before 3.39, so join from each side.
     cursor.execute(f"""
-        SELECT file_name, file_version FROM files
-        WHERE build = ? {ver_clause}
-    """, [args.build2] + ver_params)
-    build2_files = {row[0]: row[1] for row in cursor.fetchall()}
-
-    if not build1_files:
-        print(f"No files found for build {args.build1}")
-        return
-    if not build2_files:
-        print(f"No files found for build {args.build2}")
-        return
+        WITH a AS (
+            SELECT file_name, file_version, MAX(rowid) FROM files
+            WHERE build = ? {ver_clause} GROUP BY file_name
+        ), b AS (
+            SELECT file_name, file_version, MAX(rowid) FROM files
+            WHERE build = ? {ver_clause} GROUP BY file_name
+        )
+        SELECT a.file_name, a.file_version, b.file_version,
+               b.file_name IS NULL, 0
+        FROM a LEFT JOIN b USING (file_name)
+        WHERE b.file_name IS NULL OR a.file_version IS NOT b.file_version
+        UNION ALL
+        SELECT b.file_name, NULL, b.file_version, 0, 1
+        FROM b LEFT JOIN a USING (file_name)
+        WHERE a.file_name IS NULL
+        ORDER BY 1
+    """, [args.build1] + ver_params + [args.build2] + ver_params)
 
     changed = []
     added = []
     removed = []
 
-    for name, ver in build2_files.items():
-        if name not in build1_files:
-            added.append((name, ver))
-        elif build1_files[name] != ver:
-            changed.append((name, build1_files[name], ver))
-
-    for name, ver in build1_files.items():
-        if name not in build2_files:
-            removed.append((name, ver))
+    for name, old_ver, new_ver, is_removed, is_added in cursor:
+        if is_removed:
+            removed.append((name, old_ver))
+        elif is_added:
+            added.append((name, new_ver))
+        else:
+            changed.append((name, old_ver, new_ver))
 
     print(f"Diff: {args.build1} -> {args.build2}\n")
 
@@ -181,7 +274,6 @@ def cmd_diff(args):
         f"\nSummary: {len(changed)} changed, "
         f"{len(added)} added, {len(removed)} removed"
     )
-    conn.close()
 
 
 def cmd_builds(args):
@@ -191,14 +283,14 @@ def cmd_builds(args):
     ver_clause, ver_params = _version_filter(
         has_version, args.version, prefix="WHERE"
     )
+    source = _builds_source(conn, has_version)
 
     if has_version:
         cursor.execute(f"""
             SELECT version, kb_number, release_date, build, update_type,
-                   COUNT(*) as file_count
-            FROM files
+                   file_count
+            FROM {source}
             {ver_clause}
-            GROUP BY version, kb_number, release_date, build, update_type
             ORDER BY version, release_date
         """, ver_params)
 
@@ -209,17 +301,15 @@ def cmd_builds(args):
             f"{'Build':<15} {'Type':<12} {'Files'}"
         )
         print("-" * 80)
-        for row in rows:
-            print(
-                f"{row[0]:<6} {row[1]:<12} {row[2]:<15} "
-                f"{row[3]:<15} {row[4]:<12} {row[5]:,}"
-            )
+        sys.stdout.write("".join(
+            f"{row[0]:<6} {row[1]:<12} {row[2]:<15} "
+            f"{row[3]:<15} {row[4]:<12} {row[5]:,}\n"
+            for row in rows
+        ))
     else:
-        cursor.execute("""
-            SELECT kb_number, release_date, build, update_type,
-                   COUNT(*) as file_count
-            FROM files
-            GROUP BY kb_number, release_date, build, update_type
+        cursor.execute(f"""
+            SELECT kb_number, release_date, build, update_type, file_count
+            FROM {source}
             ORDER BY release_date
         """)
 
@@ -230,14 +320,13 @@ def cmd_builds(args):
             f"{'Build':<15} {'Type':<12} {'Files'}"
         )
         print("-" * 70)
-        for row in rows:
-            print(
-                f"{row[0]:<12} {row[1]:<15} "
-                f"{row[2]:<15} {row[3]:<12} {row[4]:,}"
-            )
+        sys.stdout.write("".join(
+            f"{row[0]:<12} {row[1]:<15} "
+            f"{row[2]:<15} {row[3]:<12} {row[4]:,}\n"
+            for row in rows
+        ))
 
     print(f"\nTotal: {len(rows)} patches")
-    conn.close()
 
 
 def cmd_sql(args):
@@ -246,44 +335,55 @@ def cmd_sql(args):
     cursor = conn.cursor()
 
     try:
+        cursor.arraysize = FETCH_SIZE
         cursor.execute(args.query)
-        rows = cursor.fetchall()
 
         if cursor.description:
             headers = [d[0] for d in cursor.description]
             print("\t".join(headers))
             print("-" * 80)
-            for row in rows:
-                print("\t".join(str(v) for v in row))
-            print(f"\nRows: {len(rows)}")
+            # No quoting, so values print as-is; only tabs, newlines and
+            # backslashes inside a value get a backslash escape.
+            writer = csv.writer(
+                sys.stdout, delimiter="\t", lineterminator="\n",
+                quoting=csv.QUOTE_NONE, quotechar=None, escapechar="\\",
+            )
+            total = 0
+            rows = cursor.fetchmany()
+            while rows:
+                writer.writerows(rows)
+                total += len(rows)
+                rows = cursor.fetchmany()
+            print(f"\nRows: {total}")
         else:
             print("Query executed successfully")
     except sqlite3.Error as e:
         print(f"SQL Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    conn.close()
-
 
 def cmd_stats(args):
     """Show database statistics."""
     conn, db_path, has_version = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) FROM files")
-    total_rows = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(DISTINCT kb_number) FROM files")
-    total_patches = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(DISTINCT file_name) FROM files")
-    unique_files = cursor.fetchone()[0]
-
-    cursor.execute("SELECT MIN(build), MAX(build) FROM files")
-    min_build, max_build = cursor.fetchone()
-
-    cursor.execute("SELECT MIN(release_date), MAX(release_date) FROM files")
-    min_date, max_date = cursor.fetchone()
+    # One statement, but each aggregate stays its own subquery: SQLite then
+    # answers it from the narrowest covering index, and a lone MIN(build) or
+    # MAX(build) is a single probe at one end of idx_files_build_name.
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM files),
+            (SELECT COUNT(DISTINCT kb_number) FROM files),
+            (SELECT COUNT(DISTINCT file_name) FROM files),
+            (SELECT MIN(build) FROM files),
+            (SELECT MAX(build) FROM files),
+            (SELECT MIN(release_date) FROM files),
+            (SELECT MAX(release_date) FROM files)
+    """)
+    (
+        total_rows, total_patches, unique_files,
+        min_build, max_build, min_date, max_date,
+    ) = cursor.fetchone()
 
     if has_version:
         cursor.execute(
@@ -304,8 +404,6 @@ def cmd_stats(args):
     print(f"Date range:            {min_date} -> {max_date}")
     print(f"Database location:     {db_path}")
 
-    conn.close()
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -322,10 +420,19 @@ def main():
         "search", help="Search files by name pattern"
     )
     p_search.add_argument("pattern", help="File name pattern to search")
-    p_search.add_argument(
+    match_mode = p_search.add_mutually_exclusive_group()
+    match_mode.add_argument(
         "--exact", action="store_true",
         help="Exact match instead of contains",
     )
+    match_mode.add_argument(
+        "--prefix", action="store_true",
+        help="Match names starting with the pattern (uses the index)",
+    )
+    match_mode.add_argument(
+        "--suffix", action="store_true",
+        help="Match names ending with the pattern (e.g. .sys)",
+    )
     p_search.add_argument("--limit", type=int, help="Limit results")
     p_search.set_defaults(func=cmd_search)
 
@@ -254,10 +254,33 @@ def create_indexes(conn: sqlite3.Connection) -> None:
     conn.executescript(
         """
         CREATE INDEX idx_files_version ON files(version);
-        CREATE INDEX idx_files_file_name ON files(file_name);
         CREATE INDEX idx_files_kb_number ON files(kb_number);
-        CREATE INDEX idx_files_build ON files(build);
         CREATE INDEX idx_files_file_version ON files(file_version);
+        -- Composite indexes matching query.py's search/history, diff and
+        -- builds access paths, so those read only the index.
+        CREATE INDEX idx_files_file_name_date
+            ON files(file_name, release_date);
+        CREATE INDEX idx_files_file_name_nocase
+            ON files(file_name COLLATE NOCASE);
+        CREATE INDEX idx_files_build_name
+            ON files(build, file_name, file_version);
+        CREATE INDEX idx_files_patch
+            ON files(version, kb_number, release_date, build, update_type);
+        ANALYZE;
+        """
+    )
+
+
+def create_builds_summary(conn: sqlite3.Connection) -> None:
+    # query.py's `builds` command reads per-patch file counts from here
+    # instead of grouping every row of `files` on each run.
+    conn.execute(
+        """
+        CREATE TABLE builds_summary AS
+        SELECT version, kb_number, release_date, build, update_type,
+               COUNT(*) AS file_count
+        FROM files
+        GROUP BY version, kb_number, release_date, build, update_type
         """
     )
 
@@ -540,6 +563,7 @@ def main() -> int:
             verbose,
         )
 
+        create_builds_summary(conn)
         create_indexes(conn)
         conn.commit()
 